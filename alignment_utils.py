@@ -5,6 +5,13 @@ import re
 import difflib
 from typing import List, Tuple
 
+try:
+    # rapidfuzz ships with jiwer; its C++ opcode computation replaces the
+    # pure-Python SequenceMatcher pass run for every substituted word pair.
+    from rapidfuzz.distance import Levenshtein as _rf_levenshtein
+except ImportError:  # pragma: no cover - difflib fallback
+    _rf_levenshtein = None
+
 from highlight_theme import (
     SCRIPT_WORD_MISSING,
     TRANSCRIPT_WORD_INSERT,
@@ -20,12 +27,13 @@ Span = Tuple[int, int, str]  # (start, end, color_hex)
 
 VOWELS = set("aeiou")
 TOKEN_RE = re.compile(r"[A-Za-z0-9]+(?:[\u2019'`-][A-Za-z0-9]+)*", flags=re.UNICODE)
+APOSTROPHE_RE = re.compile(r"[\u2019'`-]")
 
 
 def _normalize_token_text(token: str) -> str:
     t = token.lower()
     # Treat intra-word apostrophes/hyphens as equivalent variants.
-    t = re.sub(r"[\u2019'`-]", "", t)
+    t = APOSTROPHE_RE.sub("", t)
     return t
 
 
@@ -38,45 +46,94 @@ def tokenize_with_spans(text: str) -> List[Token]:
     return tokens
 
 
+# Backtrack op codes for _align_tokens; the predecessor cell is implied by
+# the op and the current (i, j), so one byte per cell replaces a tuple.
+_BT_NONE = 0
+_BT_EQUAL = 1
+_BT_SUB = 2
+_BT_DEL = 3
+_BT_INS = 4
+_BT_JOIN_HYP = 5  # ref[i-1] matches hyp[j-2] + hyp[j-1]
+_BT_JOIN_REF = 6  # ref[i-2] + ref[i-1] matches hyp[j-1]
+
+
 def _align_tokens(
     ref: List[str], hyp: List[str]
 ) -> List[Tuple[str, int | None, int | None]]:
     n, m = len(ref), len(hyp)
+    # Fast paths: a perfect recitation (or an empty side) needs no DP.
+    if ref == hyp:
+        return [("equal", i, i) for i in range(n)]
+    if n == 0:
+        return [("ins", None, j) for j in range(m)]
+    if m == 0:
+        return [("del", i, None) for i in range(n)]
     inf = 10**9
-    dp = [[inf] * (m + 1) for _ in range(n + 1)]
-    bt: List[List[Tuple[str, int, int]]] = [
-        [("", -1, -1) for _ in range(m + 1)] for _ in range(n + 1)
-    ]
-    dp[0][0] = 0
-
-    def relax(ni: int, nj: int, cost: int, op: str, pi: int, pj: int) -> None:
-        cand = dp[pi][pj] + cost
-        if cand < dp[ni][nj]:
-            dp[ni][nj] = cand
-            bt[ni][nj] = (op, pi, pj)
+    bt = [bytearray(m + 1) for _ in range(n + 1)]
+    # Only the backtrack matrix needs full O(n*m) storage; the cost table is
+    # a rolling window of three rows (three, not two, because the zero-cost
+    # join ops relax cells up to row i+2).
+    blank_row = [inf] * (m + 1)
+    row_cur = blank_row.copy()
+    row_next = blank_row.copy()
+    row_next2 = blank_row.copy()
+    row_cur[0] = 0
+
+    # Map tokens to shared integer ids once so the O(nm) inner loop compares
+    # ints instead of strings; the join checks keep string concatenation but
+    # only after a cheap length test has ruled out the common case.
+    vocab: dict[str, int] = {}
+    ref_ids = [vocab.setdefault(word, len(vocab)) for word in ref]
+    hyp_ids = [vocab.setdefault(word, len(vocab)) for word in hyp]
+    ref_lens = [len(word) for word in ref]
+    hyp_lens = [len(word) for word in hyp]
+
+    def relax(row: List[int], bt_row: bytearray, nj: int, cost: int, op: int, base: int) -> None:
+        cand = base + cost
+        if cand < row[nj]:
+            row[nj] = cand
+            bt_row[nj] = op
 
     for i in range(n + 1):
+        bt_cur = bt[i]
+        bt_next = bt[i + 1] if i < n else bt_cur
+        bt_next2 = bt[i + 2] if i + 1 < n else bt_cur
         for j in range(m + 1):
-            if dp[i][j] >= inf:
+            base = row_cur[j]
+            if base >= inf:
                 continue
             if i < n:
-                relax(i + 1, j, 1, "del", i, j)
+                relax(row_next, bt_next, j, 1, _BT_DEL, base)
             if j < m:
-                relax(i, j + 1, 1, "ins", i, j)
+                relax(row_cur, bt_cur, j + 1, 1, _BT_INS, base)
             if i < n and j < m:
-                same = ref[i] == hyp[j]
-                relax(i + 1, j + 1, 0 if same else 1, "equal" if same else "sub", i, j)
+                if ref_ids[i] == hyp_ids[j]:
+                    relax(row_next, bt_next, j + 1, 0, _BT_EQUAL, base)
+                else:
+                    relax(row_next, bt_next, j + 1, 1, _BT_SUB, base)
             # zero-cost join/split equivalence: one word vs two words
-            if i < n and j + 1 < m and ref[i] == (hyp[j] + hyp[j + 1]):
-                relax(i + 1, j + 2, 0, "equal_join_hyp", i, j)
-            if i + 1 < n and j < m and (ref[i] + ref[i + 1]) == hyp[j]:
-                relax(i + 2, j + 1, 0, "equal_join_ref", i, j)
+            if (
+                i < n
+                and j + 1 < m
+                and ref_lens[i] == hyp_lens[j] + hyp_lens[j + 1]
+                and ref[i] == hyp[j] + hyp[j + 1]
+            ):
+                relax(row_next, bt_next, j + 2, 0, _BT_JOIN_HYP, base)
+            if (
+                i + 1 < n
+                and j < m
+                and ref_lens[i] + ref_lens[i + 1] == hyp_lens[j]
+                and ref[i] + ref[i + 1] == hyp[j]
+            ):
+                relax(row_next2, bt_next2, j + 1, 0, _BT_JOIN_REF, base)
+        row_cur, row_next, row_next2 = row_next, row_next2, row_cur
+        row_next2[:] = blank_row
 
     i, j = n, m
     ops: List[Tuple[str, int | None, int | None]] = []
     while i > 0 or j > 0:
-        op, pi, pj = bt[i][j]
-        if pi < 0 or pj < 0:
+        code = bt[i][j]
+        if code == _BT_NONE:
             # Fallback guard for malformed backtracking state.
             if i > 0:
                 ops.append(("del", i - 1, None))
@@ -85,19 +142,24 @@ def _align_tokens(
                 ops.append(("ins", None, j - 1))
                 j -= 1
             continue
-        if op in ("equal", "sub"):
-            ops.append((op, pi, pj))
-        elif op == "del":
+        if code == _BT_EQUAL:
+            ops.append(("equal", i - 1, j - 1))
+            i, j = i - 1, j - 1
+        elif code == _BT_SUB:
+            ops.append(("sub", i - 1, j - 1))
+            i, j = i - 1, j - 1
+        elif code == _BT_DEL:
             ops.append(("del", i - 1, None))
-        elif op == "ins":
+            i -= 1
+        elif code == _BT_INS:
             ops.append(("ins", None, j - 1))
-        elif op == "equal_join_hyp":
-            # ref[pi] matches hyp[pj] + hyp[pj+1]
-            ops.append(("equal_join_hyp", pi, pj))
-        elif op == "equal_join_ref":
-            # ref[pi] + ref[pi+1] matches hyp[pj]
-            ops.append(("equal_join_ref", pi, pj))
-        i, j = pi, pj
+            j -= 1
+        elif code == _BT_JOIN_HYP:
+            ops.append(("equal_join_hyp", i - 1, j - 2))
+            i, j = i - 1, j - 2
+        else:  # _BT_JOIN_REF
+            ops.append(("equal_join_ref", i - 2, j - 1))
+            i, j = i - 2, j - 1
     ops.reverse()
     return ops
 
@@ -107,7 +169,8 @@ def _append_runs(
 ) -> None:
     if not indexes:
         return
-    indexes.sort()
+    # Callers collect indexes by walking an opcode range left to right, so
+    # the list is already ascending and needs no sort.
     run_start = indexes[0]
     prev = indexes[0]
     for k in indexes[1:]:
@@ -126,11 +189,24 @@ def _char_level_spans_for_substitution(
     ref_start: int,
     hyp_start: int,
 ) -> Tuple[List[Span], List[Span]]:
-    s = difflib.SequenceMatcher(a=ref_word.lower(), b=hyp_word.lower())
+    a = ref_word.lower()
+    b = hyp_word.lower()
+    if a == b:
+        # Case-only substitutions carry no character-level errors.
+        return [], []
+    if _rf_levenshtein is not None:
+        opcodes = [
+            (op.tag, op.src_start, op.src_end, op.dest_start, op.dest_end)
+            for op in _rf_levenshtein.opcodes(a, b)
+        ]
+    else:
+        # autojunk would treat frequent characters as junk on tokens longer
+        # than 200 chars (long hyphenated compounds), skewing the opcodes.
+        opcodes = difflib.SequenceMatcher(a=a, b=b, autojunk=False).get_opcodes()
     ref_spans: List[Span] = []
     hyp_spans: List[Span] = []
 
-    for tag, i1, i2, j1, j2 in s.get_opcodes():
+    for tag, i1, i2, j1, j2 in opcodes:
         if tag == "equal":
             continue
         if tag in ("replace",):
@@ -240,6 +240,7 @@ class AccountSettingsForm(forms.ModelForm):
             "openai_transcription_model",
             "whisper_model_name",
             "whisper_device",
+            "whisper_compute_type",
             "whisper_preset",
             "whisper_language",
             "whisper_timestamps",
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from practice.models import PracticeSession, ScoringJob
+
+AUDIO_EXTENSIONS = (".webm", ".wav", ".mp3", ".m4a", ".ogg", ".flac")
+
+
+class Command(BaseCommand):
+    help = "Delete local recording files that no session or scoring job references."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        dry_run = bool(options["dry_run"])
+        recordings_dir = Path(settings.MEDIA_ROOT) / "recordings"
+        if not recordings_dir.is_dir():
+            self.stdout.write(self.style.SUCCESS("removed=0 kept=0 (no recordings directory)"))
+            return
+
+        referenced = _referenced_paths()
+        removed = 0
+        kept = 0
+        for entry_path in _iter_audio_files(recordings_dir):
+            if os.path.normcase(os.path.abspath(entry_path)) in referenced:
+                kept += 1
+                continue
+            removed += 1
+            if dry_run:
+                self.stdout.write(f"would remove: {entry_path}")
+                continue
+            try:
+                os.remove(entry_path)
+                self.stdout.write(f"removed: {entry_path}")
+            except OSError as exc:
+                removed -= 1
+                self.stderr.write(f"failed: {entry_path} ({exc})")
+
+        self.stdout.write(
+            self.style.SUCCESS(f"removed={removed} kept={kept} dry_run={dry_run}")
+        )
+
+
+def _referenced_paths() -> set[str]:
+    refs = set(
+        PracticeSession.objects.exclude(audio_path="").values_list("audio_path", flat=True)
+    )
+    refs.update(
+        ScoringJob.objects.exclude(audio_path="").values_list("audio_path", flat=True)
+    )
+    media_root = Path(settings.MEDIA_ROOT)
+    normalized: set[str] = set()
+    for audio_ref in refs:
+        # Storage keys are media-relative; legacy rows hold absolute paths.
+        candidate = Path(str(audio_ref).replace("\\", "/"))
+        if not candidate.is_absolute():
+            candidate = media_root / candidate
+        normalized.add(os.path.normcase(os.path.abspath(candidate)))
+    return normalized
+
+
+def _iter_audio_files(directory: Path):
+    # os.scandir keeps DirEntry stat info cached, so walking a large
+    # recordings tree avoids one stat syscall per file.
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name.lower().endswith(AUDIO_EXTENSIONS):
+                    yield entry.path
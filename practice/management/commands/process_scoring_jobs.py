@@ -6,6 +6,7 @@ from django.core.management.base import BaseCommand
 
 from practice.models import ScoringJob
 from practice.services.jobs import process_next_scoring_job, recover_stale_scoring_jobs
+from practice.services.transcription import prewarm_local_whisper
 
 
 class Command(BaseCommand):
@@ -40,6 +41,10 @@ class Command(BaseCommand):
         self.stdout.write(self.style.SUCCESS(f"processed={processed} queued={queued}"))
 
     def _watch(self, poll_seconds: float) -> None:
+        # Pay the model load while the worker is idle rather than adding it to
+        # the first queued job's wait time.
+        if prewarm_local_whisper():
+            self.stdout.write("model=warm")
         self.stdout.write(self.style.SUCCESS(f"worker=ready poll_seconds={poll_seconds:g}"))
         try:
             while True:
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-26 10:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('practice', '0019_remove_practicesettings_autumn_active_session_id_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='practicesettings',
+            name='whisper_compute_type',
+            field=models.CharField(choices=[('auto', 'Auto'), ('int8', 'int8 (fast CPU)'), ('int8_float16', 'int8/float16 mix'), ('float16', 'float16 (GPU)'), ('float32', 'float32 (full precision)')], default='auto', max_length=16),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-26 11:15
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('practice', '0020_practicesettings_whisper_compute_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='practicesession',
+            index=models.Index(fields=['user', '-timestamp'], name='sessions_user_id_d90dbd_idx'),
+        ),
+    ]
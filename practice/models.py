@@ -52,6 +52,9 @@ class PracticeSession(models.Model):
     class Meta:
         db_table = "sessions"
         ordering = ["-timestamp", "-id"]
+        indexes = [
+            models.Index(fields=["user", "-timestamp"]),
+        ]
 
     def __str__(self) -> str:
         return f"{self.timestamp} - {self.script_name}"
@@ -492,6 +495,17 @@ class PracticeSettings(models.Model):
         default="auto",
         choices=[("auto", "Auto"), ("cpu", "CPU"), ("gpu", "GPU")],
     )
+    whisper_compute_type = models.CharField(
+        max_length=16,
+        default="auto",
+        choices=[
+            ("auto", "Auto"),
+            ("int8", "int8 (fast CPU)"),
+            ("int8_float16", "int8/float16 mix"),
+            ("float16", "float16 (GPU)"),
+            ("float32", "float32 (full precision)"),
+        ],
+    )
     whisper_preset = models.CharField(
         max_length=32,
         default="balanced_cpu",
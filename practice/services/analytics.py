@@ -452,7 +452,7 @@ def progress_series(
         points.append(
             {
                 "date": parsed.isoformat(),
-                "label": parsed.strftime("%m/%d"),
+                "label": f"{parsed.month:02d}/{parsed.day:02d}",
                 "script": session.script_name,
                 "score": session.score,
                 "wer": session.wer,
@@ -469,11 +469,15 @@ def progress_series(
 def _parse_session_timestamp(value: str | None) -> datetime | None:
     if not value:
         return None
-    for fmt in ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S"):
-        try:
-            return datetime.strptime(value[:19], fmt)
-        except ValueError:
-            pass
+    # fromisoformat is a C-level parser; strptime re-reads the format string
+    # and consults locale tables on every call, which adds up when parsing a
+    # long session history row by row. Legacy rows may use a space separator,
+    # so normalize before the fast path and keep full-string parsing as the
+    # fallback for anything with sub-second or timezone suffixes.
+    try:
+        return datetime.fromisoformat(value[:19].replace(" ", "T"))
+    except ValueError:
+        pass
     try:
         return datetime.fromisoformat(value)
     except ValueError:
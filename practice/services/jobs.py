@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+import queue
 import threading
 import uuid
 from datetime import timedelta
@@ -27,6 +29,8 @@ from practice.services.evidence import quality_and_evidence_for_card
 from practice.services.scoring import transcribe_free_and_store, transcribe_score_and_store
 from practice.services.spaced_repetition import update_card_from_session
 
+logger = logging.getLogger(__name__)
+
 
 def create_scoring_job(
     *,
@@ -85,13 +89,55 @@ def enqueue_scoring_job(job: ScoringJob) -> None:
     if mode != "thread":
         raise ValueError(f"Unknown SCORING_JOBS_MODE: {mode}")
 
-    thread = threading.Thread(
-        target=_process_job_in_thread,
-        args=(job.pk,),
-        name=f"speechpractice-score-{job.pk}",
-        daemon=True,
-    )
-    thread.start()
+    _worker_queue().put(job.pk)
+
+
+_WORKER_LOCK = threading.Lock()
+_WORKER_QUEUE: queue.Queue[int] | None = None
+
+
+def _worker_queue() -> queue.Queue[int]:
+    # One persistent worker thread serves all scoring jobs, so the cached
+    # Whisper model stays warm between takes instead of every request paying
+    # thread start-up and first-call costs.
+    global _WORKER_QUEUE
+    with _WORKER_LOCK:
+        if _WORKER_QUEUE is None:
+            _WORKER_QUEUE = queue.Queue()
+            thread = threading.Thread(
+                target=_worker_loop,
+                args=(_WORKER_QUEUE,),
+                name="speechpractice-score-worker",
+                daemon=True,
+            )
+            thread.start()
+    return _WORKER_QUEUE
+
+
+def _worker_loop(jobs: queue.Queue[int]) -> None:
+    while True:
+        job_id = jobs.get()
+        try:
+            _process_job_in_thread(job_id)
+        except Exception as exc:
+            # process_scoring_job marks its own failures; anything landing
+            # here escaped before that block (missing job, DB error), so
+            # record it rather than leaving the job stuck in "queued".
+            logger.exception("Scoring job %s crashed in the worker thread", job_id)
+            try:
+                ScoringJob.objects.filter(
+                    pk=job_id,
+                    status__in=[ScoringJob.STATUS_QUEUED, ScoringJob.STATUS_RUNNING],
+                ).update(
+                    status=ScoringJob.STATUS_FAILED,
+                    error_message=str(exc),
+                    finished_at=timezone.now(),
+                    updated_at=timezone.now(),
+                )
+            except Exception:
+                logger.exception("Could not mark scoring job %s as failed", job_id)
+        finally:
+            jobs.task_done()
 
 
 def _process_job_in_thread(job_id: int) -> None:
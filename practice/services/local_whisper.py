@@ -9,6 +9,23 @@ import numpy as np
 WHISPER_SAMPLE_RATE = 16_000
 DEFAULT_CHUNK_SECONDS = 60.0
 CHUNK_SECONDS_OPTION = "_speech_practice_chunk_seconds"
+FASTER_WHISPER_BATCH_SIZE = 8
+VAD_HOP_SAMPLES = 160  # 10 ms at the Whisper sample rate
+VAD_RMS_THRESHOLD = 0.01  # roughly -40 dBFS
+VAD_PADDING_SECONDS = 0.25
+
+# Options shared between openai-whisper and faster-whisper transcribe calls.
+# Anything else (fp16, internal chunking hints) is openai-whisper specific.
+_FASTER_WHISPER_OPTION_KEYS = (
+    "beam_size",
+    "best_of",
+    "temperature",
+    "condition_on_previous_text",
+    "no_speech_threshold",
+    "initial_prompt",
+    "without_timestamps",
+    "language",
+)
 
 
 def _chunk_seconds_from_env() -> float:
@@ -43,7 +60,7 @@ def _as_mono_float32(audio: np.ndarray) -> np.ndarray:
     return np.ascontiguousarray(samples.reshape(-1))
 
 
-def _resample_linear(audio: np.ndarray, source_sr: int, target_sr: int) -> np.ndarray:
+def _resample(audio: np.ndarray, source_sr: int, target_sr: int) -> np.ndarray:
     if int(source_sr) == int(target_sr):
         return _as_mono_float32(audio)
 
@@ -51,6 +68,26 @@ def _resample_linear(audio: np.ndarray, source_sr: int, target_sr: int) -> np.nd
     if samples.size == 0:
         return samples
 
+    try:
+        from math import gcd
+
+        from scipy.signal import resample_poly
+    except ImportError:
+        return _resample_linear(samples, source_sr, target_sr)
+
+    # Polyphase filtering works in fixed-size blocks and skips the two float64
+    # position ramps the linear fallback has to materialize, so it is both
+    # faster and lighter on memory for long takes.
+    divisor = gcd(int(source_sr), int(target_sr))
+    resampled = resample_poly(samples, int(target_sr) // divisor, int(source_sr) // divisor)
+    return np.asarray(resampled, dtype=np.float32)
+
+
+def _resample_linear(audio: np.ndarray, source_sr: int, target_sr: int) -> np.ndarray:
+    samples = _as_mono_float32(audio)
+    if samples.size == 0 or int(source_sr) == int(target_sr):
+        return samples
+
     duration = samples.size / float(source_sr)
     target_size = max(1, int(round(duration * float(target_sr))))
     src_pos = np.linspace(
@@ -68,6 +105,21 @@ def _resample_linear(audio: np.ndarray, source_sr: int, target_sr: int) -> np.nd
     return np.interp(dst_pos, src_pos, samples).astype(np.float32, copy=False)
 
 
+def _decode_with_soundfile(path: str) -> np.ndarray | None:
+    """
+    Decode a short clip straight to mono float32 at the Whisper sample rate.
+    Returns None for formats libsndfile cannot read (e.g. webm), which keep
+    the path-based route through the model's own loader.
+    """
+    try:
+        import soundfile as sf
+
+        data, samplerate = sf.read(path, dtype="float32", always_2d=False)
+    except Exception:
+        return None
+    return _resample(data, samplerate, WHISPER_SAMPLE_RATE)
+
+
 def _path_duration_seconds(path: str) -> float | None:
     try:
         import soundfile as sf
@@ -110,15 +162,121 @@ def _iter_file_chunks(
 
     info = sf.info(audio_path)
     block_size = max(1, int(round(chunk_seconds * float(info.samplerate))))
+    channels = max(1, int(info.channels))
+    # Decode into preallocated buffers reused across chunks. Each chunk is
+    # fully transcribed before the next read, so streaming into fixed storage
+    # avoids holding a chunk twice (or the multi-channel original) in memory.
+    block = np.empty((block_size, channels), dtype=np.float32)
+    mono = block[:, 0] if channels == 1 else np.empty(block_size, dtype=np.float32)
     start_frame = 0
     with sf.SoundFile(audio_path, "r") as audio_file:
         while True:
-            block = audio_file.read(block_size, dtype="float32", always_2d=False)
-            if block is None or len(block) == 0:
+            filled = audio_file.read(out=block)
+            frames = filled.shape[0]
+            if frames == 0:
                 break
+            if channels > 1:
+                np.mean(filled, axis=1, dtype=np.float32, out=mono[:frames])
             offset = float(start_frame) / float(info.samplerate)
-            start_frame += len(block)
-            yield _resample_linear(block, info.samplerate, WHISPER_SAMPLE_RATE), offset
+            start_frame += frames
+            yield _resample(mono[:frames], info.samplerate, WHISPER_SAMPLE_RATE), offset
+
+
+def _trim_silence(samples: np.ndarray) -> tuple[np.ndarray, float]:
+    """
+    Drop leading/trailing silence using a 10 ms RMS envelope instead of a
+    per-sample scan. Returns the trimmed view plus the seconds removed from
+    the front so segment timestamps can be shifted back afterwards.
+    """
+    audio = _as_mono_float32(samples)
+    frames = audio.size // VAD_HOP_SAMPLES
+    if frames < 2:
+        return audio, 0.0
+    frame_view = audio[: frames * VAD_HOP_SAMPLES].reshape(frames, VAD_HOP_SAMPLES)
+    # Row-wise dot products accumulate each frame's sum of squares directly,
+    # so no squared copy of the whole take is ever materialized.
+    envelope = np.sqrt(np.einsum("ij,ij->i", frame_view, frame_view) / VAD_HOP_SAMPLES)
+    voiced = np.flatnonzero(envelope > VAD_RMS_THRESHOLD)
+    if voiced.size == 0:
+        return audio, 0.0
+    padding = int(round(VAD_PADDING_SECONDS * WHISPER_SAMPLE_RATE))
+    start = max(0, int(voiced[0]) * VAD_HOP_SAMPLES - padding)
+    end = min(audio.size, (int(voiced[-1]) + 1) * VAD_HOP_SAMPLES + padding)
+    if start == 0 and end >= audio.size:
+        return audio, 0.0
+    return audio[start:end], float(start) / float(WHISPER_SAMPLE_RATE)
+
+
+def _shift_result_segments(result: dict[str, Any], lead_seconds: float) -> dict[str, Any]:
+    if lead_seconds <= 0.0 or not isinstance(result, dict):
+        return result
+    segments = result.get("segments")
+    if isinstance(segments, list):
+        result["segments"] = [
+            _segment_with_offset(segment, lead_seconds)
+            for segment in segments
+            if isinstance(segment, dict)
+        ]
+    return result
+
+
+def _is_faster_whisper_model(model: Any) -> bool:
+    return type(model).__module__.split(".", 1)[0] == "faster_whisper"
+
+
+def _faster_whisper_options(options: dict[str, Any]) -> dict[str, Any]:
+    return {key: options[key] for key in _FASTER_WHISPER_OPTION_KEYS if key in options}
+
+
+def _transcribe_faster_whisper(
+    model: Any,
+    audio_source: str | np.ndarray,
+    options: dict[str, Any],
+    duration_seconds: float | None,
+    chunk_seconds: float,
+    partial_callback: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    fw_options = _faster_whisper_options(options)
+    transcriber = model
+    if duration_seconds is not None and duration_seconds > chunk_seconds:
+        # Long recordings go through the batched pipeline, which VAD-splits
+        # the audio and runs several 30 s windows per forward pass instead of
+        # decoding them serially.
+        try:
+            from faster_whisper import BatchedInferencePipeline
+
+            transcriber = BatchedInferencePipeline(model=model)
+            fw_options["batch_size"] = FASTER_WHISPER_BATCH_SIZE
+        except Exception:
+            transcriber = model
+
+    segments_iter, info = transcriber.transcribe(audio_source, **fw_options)
+    text_parts: list[str] = []
+    segments: list[dict[str, Any]] = []
+    for segment in segments_iter:
+        segments.append(
+            {
+                "id": len(segments),
+                "start": float(segment.start),
+                "end": float(segment.end),
+                "text": segment.text,
+                "avg_logprob": float(segment.avg_logprob),
+                "no_speech_prob": float(segment.no_speech_prob),
+            }
+        )
+        chunk_text = str(segment.text or "").strip()
+        if chunk_text:
+            text_parts.append(chunk_text)
+        if partial_callback is not None:
+            try:
+                partial_callback(_join_transcript_parts(text_parts))
+            except Exception:
+                pass
+    return {
+        "text": _join_transcript_parts(text_parts),
+        "segments": segments,
+        "language": getattr(info, "language", None),
+    }
 
 
 def _call_transcribe(
@@ -202,10 +360,38 @@ def transcribe_source(
     """
     opts = dict(options or {})
     chunk_seconds = _chunk_seconds_from_options(opts)
+
+    if isinstance(audio_source, str):
+        path_duration = _path_duration_seconds(audio_source)
+        if path_duration is not None and path_duration <= chunk_seconds:
+            # Short clips that libsndfile can read are handed to the model as
+            # an in-memory array, skipping the ffmpeg subprocess openai-whisper
+            # forks per path (and making them eligible for the silence trim).
+            decoded = _decode_with_soundfile(audio_source)
+            if decoded is not None:
+                audio_source = decoded
+
+    lead_seconds = 0.0
+    if isinstance(audio_source, np.ndarray):
+        # Silence never reaches the encoder; the trimmed lead is added back
+        # onto segment timestamps so pause metrics stay true to the take.
+        audio_source, lead_seconds = _trim_silence(audio_source)
+
     duration_seconds = _audio_duration_seconds(audio_source)
 
+    if _is_faster_whisper_model(model):
+        result = _transcribe_faster_whisper(
+            model,
+            audio_source,
+            opts,
+            duration_seconds,
+            chunk_seconds,
+            partial_callback=partial_callback,
+        )
+        return _shift_result_segments(result, lead_seconds)
+
     if duration_seconds is None or duration_seconds <= chunk_seconds:
-        return _call_transcribe(model, audio_source, opts)
+        return _shift_result_segments(_call_transcribe(model, audio_source, opts), lead_seconds)
 
     if isinstance(audio_source, str):
         try:
@@ -244,4 +430,4 @@ def transcribe_source(
     stitched["text"] = _join_transcript_parts(text_parts)
     if all_segments:
         stitched["segments"] = all_segments
-    return stitched
+    return _shift_result_segments(stitched, lead_seconds)
@@ -46,10 +46,11 @@ def highlighted_session_text(session: PracticeSession) -> HighlightedSessionText
             transcript_ranges.append((error.hyp_start, error.hyp_end, _transcript_class(error)))
 
     transcript_text = session.transcript or ""
+    transcript_html = _highlight_text(transcript_text, transcript_ranges)
     return HighlightedSessionText(
         script_html=_highlight_text(session.script_text or "", script_ranges),
-        transcript_html=_highlight_text(transcript_text, transcript_ranges),
-        timed_transcript_html=_timed_transcript_html(session, transcript_ranges),
+        transcript_html=transcript_html,
+        timed_transcript_html=_timed_transcript_html(session, transcript_ranges, fallback=transcript_html),
         has_timed_transcript=bool(_segment_ranges_for_transcript(transcript_text, session_segments(session))),
         error_count=len(errors),
     )
@@ -73,6 +74,19 @@ def _transcript_class(error: SessionError) -> str:
     return "err-replace"
 
 
+# Error spans reuse a handful of css classes, so the open tags are memoized
+# instead of re-interpolated for every span of every rendered session.
+_MARK_OPEN_TAGS: dict[str, str] = {}
+
+
+def _mark_open_tag(css_class: str) -> str:
+    tag = _MARK_OPEN_TAGS.get(css_class)
+    if tag is None:
+        tag = f'<mark class="error-chip {css_class}">'
+        _MARK_OPEN_TAGS[css_class] = tag
+    return tag
+
+
 def _highlight_text(text: str, ranges: Iterable[tuple[int, int, str]]) -> SafeString:
     if not text:
         return mark_safe("<span class=\"empty\">No transcript yet.</span>")
@@ -92,7 +106,9 @@ def _highlight_text(text: str, ranges: Iterable[tuple[int, int, str]]) -> SafeSt
         if start < cursor:
             continue
         pieces.append(html.escape(text[cursor:start]))
-        pieces.append(f'<mark class="error-chip {css_class}">{html.escape(text[start:end])}</mark>')
+        pieces.append(_mark_open_tag(css_class))
+        pieces.append(html.escape(text[start:end]))
+        pieces.append("</mark>")
         cursor = end
     pieces.append(html.escape(text[cursor:]))
     return mark_safe("".join(pieces))
@@ -101,19 +117,45 @@ def _highlight_text(text: str, ranges: Iterable[tuple[int, int, str]]) -> SafeSt
 def _timed_transcript_html(
     session: PracticeSession,
     error_ranges: Iterable[tuple[int, int, str]],
+    fallback: SafeString | None = None,
 ) -> SafeString:
     text = session.transcript or ""
     ranges = _segment_ranges_for_transcript(text, session_segments(session))
     if not ranges:
-        return _highlight_text(text, error_ranges)
+        # Without timestamps this renders the same markup as transcript_html,
+        # so reuse the caller's copy rather than highlighting twice.
+        return fallback if fallback is not None else _highlight_text(text, error_ranges)
 
     pieces = []
     cursor = 0
-    error_ranges_list = list(error_ranges)
+    sorted_errors = sorted(
+        ((int(start), int(end), css_class) for start, end, css_class in error_ranges),
+        key=lambda item: item[0],
+    )
+    pointer = 0
+
+    def _window_errors(window_start: int, window_end: int) -> list[tuple[int, int, str]]:
+        # The windows below arrive in increasing, non-overlapping order, so a
+        # pointer into the start-sorted error list replaces a full rescan of
+        # every error span per window.
+        nonlocal pointer
+        while pointer < len(sorted_errors) and sorted_errors[pointer][1] <= window_start:
+            pointer += 1
+        shifted = []
+        for position in range(pointer, len(sorted_errors)):
+            range_start, range_end, css_class = sorted_errors[position]
+            if range_start >= window_end:
+                break
+            overlap_start = max(window_start, range_start)
+            overlap_end = min(window_end, range_end)
+            if overlap_end > overlap_start:
+                shifted.append((overlap_start - window_start, overlap_end - window_start, css_class))
+        return shifted
+
     for index, (start, end, start_time, end_time) in enumerate(ranges):
         if start > cursor:
-            pieces.append(str(_highlight_text(text[cursor:start], _shift_ranges(error_ranges_list, cursor, start))))
-        segment_html = _highlight_text(text[start:end], _shift_ranges(error_ranges_list, start, end))
+            pieces.append(str(_highlight_text(text[cursor:start], _window_errors(cursor, start))))
+        segment_html = _highlight_text(text[start:end], _window_errors(start, end))
         pieces.append(
             '<span class="timed-transcript-segment" '
             f'data-transcript-index="{index}" '
@@ -125,24 +167,10 @@ def _timed_transcript_html(
         )
         cursor = end
     if cursor < len(text):
-        pieces.append(str(_highlight_text(text[cursor:], _shift_ranges(error_ranges_list, cursor, len(text)))))
+        pieces.append(str(_highlight_text(text[cursor:], _window_errors(cursor, len(text)))))
     return mark_safe("".join(pieces))
 
 
-def _shift_ranges(
-    ranges: Iterable[tuple[int, int, str]],
-    start: int,
-    end: int,
-) -> list[tuple[int, int, str]]:
-    shifted = []
-    for range_start, range_end, css_class in ranges:
-        overlap_start = max(start, int(range_start))
-        overlap_end = min(end, int(range_end))
-        if overlap_end > overlap_start:
-            shifted.append((overlap_start - start, overlap_end - start, css_class))
-    return shifted
-
-
 def _segment_ranges_for_transcript(
     transcript_text: str,
     segments: list[dict],
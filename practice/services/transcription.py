@@ -7,12 +7,13 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Protocol
 
+import numpy as np
 from django.conf import settings
 from django.db.utils import OperationalError, ProgrammingError
 
 from practice.models import PracticeSettings
 from practice.services.codex_auth import codex_access_token
-from practice.services.local_whisper import transcribe_source
+from practice.services.local_whisper import WHISPER_SAMPLE_RATE, transcribe_source
 
 OPENAI_TIMESTAMPED_TRANSCRIPTION_MODEL = "whisper-1"
 
@@ -58,6 +59,10 @@ class LocalWhisperProvider:
             or (app_settings.whisper_device if app_settings else None)
             or settings.WHISPER_DEVICE
         )
+        self.compute_type = (
+            (app_settings.whisper_compute_type if app_settings else None)
+            or settings.WHISPER_COMPUTE_TYPE
+        )
         self.language = (
             language
             or (app_settings.whisper_language if app_settings else None)
@@ -69,7 +74,7 @@ class LocalWhisperProvider:
         audio_path: str,
         partial_callback: Callable[[str], None] | None = None,
     ) -> TranscriptResult:
-        model = _load_whisper_model(self.model_name, self.device)
+        model = _load_whisper_model(self.model_name, self.device, self.compute_type)
         options = _whisper_options(self.app_settings)
         if self.language and self.language != "auto":
             options["language"] = self.language
@@ -304,12 +309,70 @@ class UploadedTranscriptProvider:
         )
 
 
-@lru_cache(maxsize=4)
-def _load_whisper_model(model_name: str, device: str):
-    import whisper
+def _quantize_linear_int8(model):
+    """
+    Swap the model's Linear layers for dynamic int8 kernels.
 
+    torch.ao.quantization matches modules by exact type, and whisper's
+    projections are a *subclass* of nn.Linear, so the qconfig spec and
+    swap mapping must be keyed on each concrete class present in the
+    model — passing {torch.nn.Linear} silently swaps nothing.
+    """
+    import torch
+
+    linear_types = {
+        type(module)
+        for module in model.modules()
+        if isinstance(module, torch.nn.Linear)
+    }
+    if not linear_types:
+        return model
+    return torch.ao.quantization.quantize_dynamic(
+        model,
+        qconfig_spec={
+            cls: torch.ao.quantization.default_dynamic_qconfig for cls in linear_types
+        },
+        mapping={cls: torch.ao.nn.quantized.dynamic.Linear for cls in linear_types},
+    )
+
+
+@lru_cache(maxsize=4)
+def _load_whisper_model(model_name: str, device: str, compute_type: str = "auto"):
     resolved_device = _resolve_device(device)
-    return whisper.load_model(model_name, device=resolved_device)
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        import whisper
+
+        model = whisper.load_model(model_name, device=resolved_device)
+        if resolved_device == "cpu" and compute_type in {"auto", "int8"}:
+            # Dynamic int8 quantization of the Linear layers is the
+            # openai-whisper equivalent of the CTranslate2 int8 path: the
+            # GEMMs run through quantized kernels for a sizable CPU speedup
+            # at negligible WER cost. Explicit float settings skip it.
+            try:
+                model = _quantize_linear_int8(model)
+            except Exception:
+                pass
+        return model
+    # Prefer the CTranslate2 backend when installed; transcribe_source adapts
+    # its call signature and result shape to the openai-whisper format. On CPU
+    # the GEMM kernels scale with threads, so use every core instead of the
+    # library's conservative default.
+    return WhisperModel(
+        model_name,
+        device=resolved_device,
+        compute_type=_resolve_compute_type(compute_type, resolved_device),
+        cpu_threads=os.cpu_count() or 0,
+    )
+
+
+def _resolve_compute_type(compute_type: str, resolved_device: str) -> str:
+    if compute_type and compute_type != "auto":
+        return compute_type
+    # int8 halves memory bandwidth on CPU for roughly double the throughput;
+    # fp16 gives a similar win on CUDA. Both cost <1% WER.
+    return "float16" if resolved_device == "cuda" else "int8"
 
 
 def _resolve_device(device: str) -> str:
@@ -331,6 +394,32 @@ def _has_cuda() -> bool:
         return False
 
 
+def prewarm_local_whisper(user=None) -> bool:
+    """
+    Load and cache the configured local Whisper model ahead of the first job.
+    Long-running workers call this at startup so the multi-second model load
+    happens before any take is waiting on it. Returns False when another
+    provider is configured or the model cannot be loaded.
+    """
+    app_settings = _practice_settings(user)
+    provider_name = (
+        (app_settings.transcription_provider if app_settings else None)
+        or settings.TRANSCRIPTION_PROVIDER
+    )
+    if provider_name != "local_whisper":
+        return False
+    try:
+        provider = LocalWhisperProvider(user=user)
+        model = _load_whisper_model(provider.model_name, provider.device, provider.compute_type)
+        # Both backends do lazy kernel/graph setup on their first call, so run
+        # one second of silence through the model to keep that cost out of the
+        # first real take as well.
+        transcribe_source(model, np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32), {})
+    except Exception:
+        return False
+    return True
+
+
 def get_transcription_provider(provider_name: str | None = None, user=None) -> TranscriptionProvider:
     app_settings = _practice_settings(user)
     provider = provider_name or (app_settings.transcription_provider if app_settings else None) or settings.TRANSCRIPTION_PROVIDER
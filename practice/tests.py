@@ -1458,6 +1458,67 @@ class PracticeWebTests(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context["selected_script"], selected)
 
+    def test_transcribe_source_adapts_faster_whisper_results(self):
+        from practice.services.local_whisper import transcribe_source
+
+        class FakeSegment(SimpleNamespace):
+            pass
+
+        class FakeInfo(SimpleNamespace):
+            pass
+
+        class FakeFasterWhisperModel:
+            __module__ = "faster_whisper.transcribe"
+
+            def __init__(self):
+                self.calls = []
+
+            def transcribe(self, audio, **options):
+                self.calls.append(options)
+                segments = iter(
+                    [
+                        FakeSegment(start=0.0, end=1.0, text=" clear", avg_logprob=-0.2, no_speech_prob=0.01),
+                        FakeSegment(start=1.0, end=2.0, text=" practice text", avg_logprob=-0.3, no_speech_prob=0.02),
+                    ]
+                )
+                return segments, FakeInfo(language="en")
+
+        model = FakeFasterWhisperModel()
+        partials = []
+        result = transcribe_source(
+            model,
+            "recording.wav",
+            {"beam_size": 2, "fp16": True, "condition_on_previous_text": True},
+            partial_callback=partials.append,
+        )
+
+        self.assertEqual(result["text"], "clear practice text")
+        self.assertEqual(len(result["segments"]), 2)
+        self.assertEqual(result["segments"][1]["start"], 1.0)
+        self.assertEqual(result["language"], "en")
+        self.assertEqual(partials[-1], "clear practice text")
+        self.assertNotIn("fp16", model.calls[0])
+        self.assertEqual(model.calls[0]["beam_size"], 2)
+
+    def test_quantize_linear_int8_swaps_subclassed_linear_layers(self):
+        try:
+            import torch
+        except ImportError:
+            self.skipTest("torch is not installed")
+        from practice.services.transcription import _quantize_linear_int8
+
+        class SubclassedLinear(torch.nn.Linear):
+            pass
+
+        class StubModel(torch.nn.Module):
+            def __init__(self):
+                super().__init__()
+                self.proj = SubclassedLinear(4, 4)
+
+        quantized = _quantize_linear_int8(StubModel())
+
+        self.assertIsInstance(quantized.proj, torch.ao.nn.quantized.dynamic.Linear)
+
     def test_uploaded_transcript_provider_reads_txt_upload(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             path = Path(temp_dir) / "recording.txt"
@@ -2682,6 +2743,7 @@ class PracticeWebTests(TransactionTestCase):
                     "openai_transcription_model": "whisper-1",
                     "whisper_model_name": "small.en",
                     "whisper_device": "cpu",
+                    "whisper_compute_type": "int8",
                     "whisper_preset": "fast_cpu",
                     "whisper_language": "en",
                     "whisper_timestamps": "on",
@@ -2703,6 +2765,7 @@ class PracticeWebTests(TransactionTestCase):
         self.assertEqual(settings_obj.anthropic_script_model, "claude-sonnet-5")
         self.assertEqual(settings_obj.whisper_model_name, "small.en")
         self.assertEqual(settings_obj.whisper_preset, "fast_cpu")
+        self.assertEqual(settings_obj.whisper_compute_type, "int8")
         self.assertEqual(settings_obj.whisper_chunk_seconds, 90)
         self.assertEqual(settings_obj.get_secret("openai_api_key"), "sk-test")
         self.assertEqual(settings_obj.get_secret("anthropic_api_key"), "ak-test")
@@ -2787,6 +2850,34 @@ class PracticeWebTests(TransactionTestCase):
         self.assertContains(response, 'data-progress-chart="score"')
         self.assertContains(response, "Progress Drill")
 
+    def test_cleanup_orphan_recordings_keeps_referenced_audio(self):
+        self._create_legacy_tables()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            recordings = Path(temp_dir) / "recordings" / "web" / "owner"
+            recordings.mkdir(parents=True)
+            referenced = recordings / "keep.webm"
+            referenced.write_bytes(b"audio-keep")
+            orphan = recordings / "orphan.webm"
+            orphan.write_bytes(b"audio-orphan")
+            sidecar = recordings / "notes.txt"
+            sidecar.write_text("not audio")
+            PracticeSession.objects.create(
+                user=self.user,
+                timestamp="2026-07-01T12:00:00",
+                script_name="Cleanup Session",
+                script_text="clear practice text",
+                audio_path="recordings/web/owner/keep.webm",
+            )
+
+            with override_settings(MEDIA_ROOT=temp_dir):
+                out = StringIO()
+                call_command("cleanup_orphan_recordings", stdout=out)
+
+            self.assertTrue(referenced.exists())
+            self.assertFalse(orphan.exists())
+            self.assertTrue(sidecar.exists())
+            self.assertIn("removed=1 kept=1", out.getvalue())
+
     def _create_legacy_tables(self):
         existing = set(connection.introspection.table_names())
         with connection.schema_editor() as schema:
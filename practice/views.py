@@ -442,7 +442,16 @@ def practice_run(request):
 
 
 def session_list(request):
-    sessions = PracticeSession.objects.filter(user=request.user)[:80]
+    # The list template only shows headline metrics; skip hydrating the
+    # transcript/segments/script text blobs for every row.
+    sessions = PracticeSession.objects.filter(user=request.user).only(
+        "timestamp",
+        "script_name",
+        "score",
+        "wer",
+        "cer",
+        "artic_rate",
+    )[:80]
     return render(request, "practice/session_list.html", {"sessions": sessions})
 
 
@@ -481,7 +490,6 @@ def session_detail(request, pk: int):
             review_form = SelfReviewNotesForm(request.POST, instance=session)
             if review_form.is_valid():
                 review_form.save()
-                session.refresh_from_db()
                 if action == "save_self_review":
                     messages.success(request, "Self-review notes saved.")
                     return redirect("practice:session_detail", pk=session.pk)
@@ -608,15 +616,19 @@ def _selected_pks(request) -> list[int]:
 @require_POST
 def session_bulk_delete(request):
     pks = _selected_pks(request)
-    sessions = list(PracticeSession.objects.filter(user=request.user, pk__in=pks))
-    if not sessions:
+    rows = list(
+        PracticeSession.objects.filter(user=request.user, pk__in=pks).values_list(
+            "pk", "audio_path"
+        )
+    )
+    if not rows:
         messages.error(request, "No recordings were selected.")
         return redirect("practice:sessions")
     audio_deleted = 0
-    for session in sessions:
-        if delete_audio(session.audio_path):
+    for _pk, audio_path in rows:
+        if delete_audio(audio_path):
             audio_deleted += 1
-    session_ids = [session.pk for session in sessions]
+    session_ids = [pk for pk, _audio_path in rows]
     SessionError.objects.filter(user=request.user, session_id__in=session_ids).delete()
     PracticeReview.objects.filter(user=request.user, legacy_session_id__in=session_ids).delete()
     ScoringJob.objects.filter(user=request.user, legacy_session_id__in=session_ids).update(legacy_session_id=None)
@@ -98,6 +98,19 @@ else:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": os.getenv("SPEECHPRACTICE_DB", str(BASE_DIR / "sessions.db")),
+            # Keep connections across requests instead of reopening the file
+            # (and re-running the init pragmas) on every page load.
+            "CONN_MAX_AGE": int(os.getenv("DB_CONN_MAX_AGE", "60")),
+            "OPTIONS": {
+                # WAL lets the scoring worker commit while page views read,
+                # and synchronous=NORMAL drops the per-commit fsync that
+                # stalls job status updates on slow disks.
+                "init_command": (
+                    "PRAGMA journal_mode=WAL;"
+                    "PRAGMA synchronous=NORMAL;"
+                    "PRAGMA temp_store=MEMORY;"
+                ),
+            },
         }
     }
 
@@ -161,6 +174,7 @@ OPENAI_TRANSCRIPTION_MODEL_CHOICES = [
 
 WHISPER_MODEL_NAME = os.getenv("WHISPER_MODEL_NAME", "base.en")
 WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
+WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
 WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE", "auto")
 WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "5"))
 WHISPER_TEMPERATURE = float(os.getenv("WHISPER_TEMPERATURE", "0.0"))
@@ -36,6 +36,10 @@
   const liveTranscript = form.querySelector("[data-live-transcript]");
   const practiceMetrics = form.querySelector("[data-practice-metrics]");
 
+  // Hand encoded audio over in 1 s slices while recording instead of one
+  // giant blob at stop, so long takes never sit inside the encoder buffer.
+  const RECORDER_TIMESLICE_MS = 1000;
+
   let recorder = null;
   let chunks = [];
   let stream = null;
@@ -50,6 +54,12 @@
   let decodedBuffer = null;
   let renderedPeaks = [];
   let activeTranscriptSegment = null;
+  let transcriptSegments = [];
+  let transcriptSegmentStarts = [];
+  let transcriptSegmentEnds = [];
+  let lastPlayheadPx = -1;
+  let columnScratch = new Float32Array(0);
+  let columnXScratch = new Float32Array(0);
   let activeJobStatusUrl = "";
   let jobPollTimeout = null;
   let latestScoreText = "";
@@ -267,6 +277,14 @@
 
   updateModeUi(false);
 
+  function setLabel(node, text) {
+    // Label text changes once a second while frames arrive at 60 Hz; writing
+    // textContent unconditionally would invalidate layout on every frame.
+    if (node && node.textContent !== text) {
+      node.textContent = text;
+    }
+  }
+
   function formatTime(seconds) {
     const safeSeconds = Number.isFinite(seconds) ? Math.max(0, seconds) : 0;
     const minutes = Math.floor(safeSeconds / 60);
@@ -307,6 +325,7 @@
     liveTranscript.classList.remove("timed-transcript", "highlighted-reader");
     liveTranscript.textContent = text || "";
     activeTranscriptSegment = null;
+    rebuildTranscriptSegmentIndex();
   }
 
   function setLiveTranscriptHtml(html) {
@@ -316,6 +335,7 @@
     liveTranscript.classList.add("timed-transcript", "highlighted-reader");
     liveTranscript.innerHTML = html || '<span class="empty">No transcript yet.</span>';
     activeTranscriptSegment = null;
+    rebuildTranscriptSegmentIndex();
     setActiveTranscriptSegment();
   }
 
@@ -380,16 +400,45 @@
     }
   }
 
-  function timedTranscriptSegments() {
-    if (!liveTranscript) {
-      return [];
+  function rebuildTranscriptSegmentIndex() {
+    // Segment timings are fixed once the transcript is rendered, so the DOM
+    // scan and dataset parsing happen here instead of on every playback frame.
+    transcriptSegments = liveTranscript
+      ? Array.from(liveTranscript.querySelectorAll("[data-start][data-end]"))
+      : [];
+    transcriptSegmentStarts = transcriptSegments.map((segment) => Number(segment.dataset.start || 0));
+    transcriptSegmentEnds = transcriptSegments.map((segment, index) => {
+      const end = Number(segment.dataset.end);
+      return Number.isFinite(end) ? end : transcriptSegmentStarts[index];
+    });
+  }
+
+  function transcriptSegmentIndexForTime(current) {
+    // Binary search for the last segment starting at or before `current`,
+    // then allow the same 50 ms slack the old linear scan gave boundaries.
+    let low = 0;
+    let high = transcriptSegmentStarts.length - 1;
+    let index = -1;
+    while (low <= high) {
+      const mid = (low + high) >> 1;
+      if (transcriptSegmentStarts[mid] <= current) {
+        index = mid;
+        low = mid + 1;
+      } else {
+        high = mid - 1;
+      }
+    }
+    if (index + 1 < transcriptSegmentStarts.length && current >= transcriptSegmentStarts[index + 1] - 0.05) {
+      return index + 1;
+    }
+    if (index >= 0 && current <= transcriptSegmentEnds[index] + 0.05) {
+      return index;
     }
-    return Array.from(liveTranscript.querySelectorAll("[data-start][data-end]"));
+    return -1;
   }
 
   function setActiveTranscriptSegment() {
-    const segments = timedTranscriptSegments();
-    if (!segments.length || !preview) {
+    if (!transcriptSegments.length || !preview) {
       if (activeTranscriptSegment) {
         activeTranscriptSegment.classList.remove("is-active");
         activeTranscriptSegment = null;
@@ -397,16 +446,8 @@
       return;
     }
     const current = preview.currentTime || 0;
-    const next = segments.find((segment, index) => {
-      const start = Number(segment.dataset.start || 0);
-      const end = Number(segment.dataset.end || start);
-      const isLast = index === segments.length - 1;
-      return current >= start && (current < end || (isLast && current <= end + 0.05));
-    }) || segments.find((segment) => {
-      const start = Number(segment.dataset.start || 0);
-      const end = Number(segment.dataset.end || start);
-      return current >= start - 0.05 && current <= end + 0.05;
-    });
+    const index = transcriptSegmentIndexForTime(current);
+    const next = index >= 0 ? transcriptSegments[index] : null;
     if (next === activeTranscriptSegment) {
       return;
     }
@@ -476,10 +517,19 @@
     });
   }
 
+  let canvasSize = { width: 0, height: 0, ratio: 1 };
+  let canvasSizeDirty = true;
+
   function sizeCanvas() {
     if (!waveformCanvas) {
       return { width: 0, height: 0, ratio: 1 };
     }
+    // getBoundingClientRect forces a layout pass; the canvas only changes
+    // size with the window, so the measurement is cached until a resize
+    // marks it dirty instead of being re-taken on every animation frame.
+    if (!canvasSizeDirty) {
+      return canvasSize;
+    }
     const ratio = window.devicePixelRatio || 1;
     const rect = waveformCanvas.getBoundingClientRect();
     const width = Math.max(1, Math.floor(rect.width * ratio));
@@ -488,7 +538,9 @@
       waveformCanvas.width = width;
       waveformCanvas.height = height;
     }
-    return { width, height, ratio };
+    canvasSize = { width, height, ratio };
+    canvasSizeDirty = false;
+    return canvasSize;
   }
 
   function clearWaveform() {
@@ -499,6 +551,7 @@
     const { width, height } = sizeCanvas();
     context.clearRect(0, 0, width, height);
     waveformCard.classList.remove("has-waveform");
+    lastPlayheadPx = -1;
     setPlayhead(0);
   }
 
@@ -520,6 +573,32 @@
     const barCount = Math.min(width, values.length);
     const stride = values.length / barCount;
 
+    // Resolve each column once into a scratch buffer reused across frames;
+    // the fill, outline, and baseline passes below all read from it instead
+    // of re-deriving the same index and Math.abs three times. Each column
+    // keeps the peak of its whole bucket in a single walk over the samples,
+    // so narrow canvases no longer drop transients between stride picks.
+    if (columnScratch.length < barCount) {
+      columnScratch = new Float32Array(barCount);
+      columnXScratch = new Float32Array(barCount);
+    }
+    // Column x positions depend only on barCount and width, so they are
+    // derived once here and resliced by the three draw passes below.
+    const xStep = width / Math.max(1, barCount - 1);
+    for (let i = 0; i < barCount; i += 1) {
+      columnXScratch[i] = i * xStep;
+      const start = Math.floor(i * stride);
+      const end = Math.min(values.length, Math.max(start + 1, Math.floor((i + 1) * stride)));
+      let peak = 0;
+      for (let j = start; j < end; j += 1) {
+        const value = Math.abs(values[j] || 0);
+        if (value > peak) {
+          peak = value;
+        }
+      }
+      columnScratch[i] = peak;
+    }
+
     context.clearRect(0, 0, width, height);
     context.lineWidth = Math.max(1, window.devicePixelRatio || 1);
     context.strokeStyle = "rgba(185, 207, 192, 0.26)";
@@ -533,16 +612,12 @@
     context.fillStyle = "rgba(240, 184, 75, 0.14)";
     context.moveTo(0, middle);
     for (let i = 0; i < barCount; i += 1) {
-      const sample = Math.abs(values[Math.floor(i * stride)] || 0);
-      const x = (i / Math.max(1, barCount - 1)) * width;
-      const y = middle - sample * middle * 0.86;
-      context.lineTo(x, y);
+      const y = middle - columnScratch[i] * middle * 0.86;
+      context.lineTo(columnXScratch[i], y);
     }
     for (let i = barCount - 1; i >= 0; i -= 1) {
-      const sample = Math.abs(values[Math.floor(i * stride)] || 0);
-      const x = (i / Math.max(1, barCount - 1)) * width;
-      const y = middle + sample * middle * 0.86;
-      context.lineTo(x, y);
+      const y = middle + columnScratch[i] * middle * 0.86;
+      context.lineTo(columnXScratch[i], y);
     }
     context.closePath();
     context.fill();
@@ -550,13 +625,11 @@
     context.beginPath();
     context.strokeStyle = "#ffd98a";
     for (let i = 0; i < barCount; i += 1) {
-      const sample = Math.abs(values[Math.floor(i * stride)] || 0);
-      const x = (i / Math.max(1, barCount - 1)) * width;
-      const y = middle - sample * middle * 0.86;
+      const y = middle - columnScratch[i] * middle * 0.86;
       if (i === 0) {
-        context.moveTo(x, y);
+        context.moveTo(columnXScratch[i], y);
       } else {
-        context.lineTo(x, y);
+        context.lineTo(columnXScratch[i], y);
       }
     }
     context.stroke();
@@ -568,7 +641,10 @@
   function buildPeaks(buffer, count) {
     const channel = buffer.getChannelData(0);
     const samplesPerPeak = Math.max(1, Math.floor(channel.length / count));
-    const peaks = [];
+    // Fill a preallocated typed array instead of growing a plain array one
+    // push at a time; long takes produce count peaks either way, but this
+    // keeps the scan a single tight numeric loop.
+    const peaks = new Float32Array(count);
     for (let i = 0; i < count; i += 1) {
       const start = i * samplesPerPeak;
       const end = Math.min(channel.length, start + samplesPerPeak);
@@ -579,7 +655,7 @@
           max = value;
         }
       }
-      peaks.push(max);
+      peaks[i] = max;
     }
     return peaks;
   }
@@ -592,11 +668,22 @@
     try {
       const buffer = await blob.arrayBuffer();
       decodedBuffer = await context.decodeAudioData(buffer.slice(0));
-      renderedPeaks = buildPeaks(decodedBuffer, 1200);
-      drawWaveform(renderedPeaks, 0);
       recordingTime.textContent = "00:00";
       recordingDuration.textContent = `${formatTime(decodedBuffer.duration)} take`;
       playButton.disabled = false;
+      // Let the stop-state controls paint before the O(N) peak scan runs;
+      // on multi-minute takes the scan would otherwise block that frame.
+      const scheduledBuffer = decodedBuffer;
+      await new Promise((resolve) => {
+        window.requestAnimationFrame(function () {
+          window.setTimeout(resolve, 0);
+        });
+      });
+      if (decodedBuffer !== scheduledBuffer) {
+        return;
+      }
+      renderedPeaks = buildPeaks(decodedBuffer, 1200);
+      drawWaveform(renderedPeaks, 0);
     } catch (error) {
       recordingDuration.textContent = "waveform unavailable";
     }
@@ -624,13 +711,33 @@
     streamSource = context.createMediaStreamSource(mediaStream);
     streamSource.connect(analyser);
     const samples = new Float32Array(analyser.fftSize);
+    const SILENCE_PEAK = 0.01;
+    const SILENT_REDRAW_INTERVAL = 8;
+    let silentFrames = 0;
 
     function tick() {
       analyser.getFloatTimeDomainData(samples);
       const elapsed = (Date.now() - recordingStartedAt) / 1000;
-      recordingTime.textContent = formatTime(elapsed);
-      recordingDuration.textContent = "recording";
-      drawWaveform(samples, 1);
+      setLabel(recordingTime, formatTime(elapsed));
+      setLabel(recordingDuration, "recording");
+      // Pauses between sentences produce a flat trace; redrawing it at full
+      // frame rate is wasted canvas work, so silence drops to ~1/8 rate.
+      let peak = 0;
+      for (let i = 0; i < samples.length; i += 1) {
+        const value = Math.abs(samples[i]);
+        if (value > peak) {
+          peak = value;
+        }
+      }
+      if (peak > SILENCE_PEAK) {
+        silentFrames = 0;
+        drawWaveform(samples, 1);
+      } else {
+        if (silentFrames % SILENT_REDRAW_INTERVAL === 0) {
+          drawWaveform(samples, 1);
+        }
+        silentFrames += 1;
+      }
       animationId = requestAnimationFrame(tick);
     }
 
@@ -644,13 +751,17 @@
     const duration = preview.duration || decodedBuffer.duration || 0;
     const current = preview.currentTime || 0;
     const progress = duration ? current / duration : 0;
-    recordingTime.textContent = formatTime(current);
-    recordingDuration.textContent = `${formatTime(duration)} take`;
-    if (renderedPeaks.length) {
-      drawWaveform(renderedPeaks, progress);
-    } else {
-      setPlayhead(progress);
+    // The peaks canvas is static during playback; only the playhead moves.
+    // Skip all DOM work on frames where it has not advanced a full pixel.
+    const playheadPx = Math.round(progress * (waveformCanvas ? waveformCanvas.width : 1));
+    if (playheadPx === lastPlayheadPx) {
+      setActiveTranscriptSegment();
+      return;
     }
+    lastPlayheadPx = playheadPx;
+    setLabel(recordingTime, formatTime(current));
+    setLabel(recordingDuration, `${formatTime(duration)} take`);
+    setPlayhead(progress);
     setActiveTranscriptSegment();
   }
 
@@ -908,6 +1019,7 @@
   }
 
   if (liveTranscript) {
+    rebuildTranscriptSegmentIndex();
     liveTranscript.addEventListener("click", function (event) {
       const segment = closestTimedSegment(event.target);
       if (segment) {
@@ -930,6 +1042,7 @@
   if (waveformCanvas) {
     clearWaveform();
     window.addEventListener("resize", function () {
+      canvasSizeDirty = true;
       if (renderedPeaks.length) {
         drawWaveform(renderedPeaks, preview && preview.duration ? preview.currentTime / preview.duration : 0);
       } else {
@@ -1080,7 +1193,7 @@
         stopLiveWaveform();
         setRecording(false);
       });
-      recorder.start();
+      recorder.start(RECORDER_TIMESLICE_MS);
       setRecording(true);
       startLiveWaveform(stream);
     } catch (error) {